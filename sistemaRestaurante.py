@@ -1,40 +1,117 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from datetime import datetime
 
 # Nodo para la lista enlazada
 # Cada nodo representa un cliente en la lista de espera
 class Node:
+    # Atributos fijos: sin __dict__ por nodo, menos memoria por cliente
+    __slots__ = ('client_name', 'party_size', 'reservation_time', 'next', 'prev')
+
     def __init__(self, client_name, party_size, reservation_time):
         self.client_name = client_name  # Nombre del cliente
         self.party_size = party_size    # Número de personas en el grupo
-        self.reservation_time = reservation_time  # Hora de la reserva
+        self.reservation_time = reservation_time  # Hora de la reserva (minutos desde medianoche)
         self.next = None  # Puntero al siguiente nodo en la lista
+        self.prev = None  # Puntero al nodo anterior en la lista
 
 # Clase principal que gestiona la lista de espera del restaurante
-# Implementa una lista enlazada simple con operaciones específicas
+# Implementa una lista doblemente enlazada con operaciones específicas
 class RestaurantWaitlist:
     def __init__(self):
         self.head = None  # Puntero al primer nodo de la lista (cabeza)
+        self.tail = None  # Puntero al último nodo de la lista (cola)
+        # Índice por nombre: cada nombre apunta a sus nodos en orden de llegada
+        self._by_name = {}
+        # Cantidad de grupos en espera por tamaño de grupo
+        self._size_counts = {}
         # Mesas disponibles por tamaño (2, 4, 6 personas)
-        # Diccionario que almacena la cantidad de mesas disponibles de cada tamaño
-        self.tables = {2: 5, 4: 3, 6: 2}  # inicial: 5 mesas de 2, 3 de 4, 2 de 6
+        # Tupla ordenada de tamaños y lista paralela con la cantidad de mesas
+        # disponibles de cada tamaño, ambas indexadas por posición
+        self._sizes = (2, 4, 6)
+        self._avail = [5, 3, 2]  # inicial: 5 mesas de 2, 3 de 4, 2 de 6
+        self._size_to_idx = {size: i for i, size in enumerate(self._sizes)}
+        # Tabla de búsqueda: tamaño de grupo -> índice de la mesa más pequeña que lo acomoda
+        self._size_map = {}
+        for party_size in range(1, self._sizes[-1] + 1):
+            self._size_map[party_size] = next(
+                i for i, size in enumerate(self._sizes) if party_size <= size)
         self.wait_time_per_table = 30  # tiempo promedio por mesa en minutos
 
+    @property
+    def tables(self):
+        """Mesas disponibles por tamaño como diccionario {tamaño: cantidad}"""
+        return dict(zip(self._sizes, self._avail))
+
     def add_client(self, client_name, party_size, reservation_time):
         """Añadir cliente al final de la lista de espera"""
         new_node = Node(client_name, party_size, reservation_time)
         
-        # Si la lista está vacía, el nuevo nodo se convierte en la cabeza
+        # Si la lista está vacía, el nuevo nodo es a la vez cabeza y cola
+        if not self.head:
+            self.head = self.tail = new_node
+        else:
+            # Enlazar el último nodo con el nuevo nodo sin recorrer la lista
+            new_node.prev = self.tail
+            self.tail.next = new_node
+            self.tail = new_node
+
+        # Registrar el nodo en el índice (puede haber nombres repetidos)
+        self._by_name.setdefault(client_name, []).append(new_node)
+        self._size_counts[party_size] = self._size_counts.get(party_size, 0) + 1
+
+    def add_clients_bulk(self, entries):
+        """Añadir varios clientes (nombre, grupo, hora) al final de la lista de una vez"""
+        it = iter(entries)
+        try:
+            first = next(it)
+        except StopIteration:
+            return  # No hay clientes que añadir
+
+        # Construir la cadena de nodos por separado
+        head = tail = Node(*first)
+        for entry in it:
+            node = Node(*entry)
+            node.prev = tail
+            tail.next = node
+            tail = node
+
+        # Enlazar la cadena completa al final de la lista con un solo empalme
         if not self.head:
-            self.head = new_node
+            self.head = head
         else:
-            # Recorrer hasta el final de la lista
-            current = self.head
-            while current.next:
-                current = current.next
-            # Enlazar el último nodo con el nuevo nodo
-            current.next = new_node
+            head.prev = self.tail
+            self.tail.next = head
+        self.tail = tail
+
+        # Registrar los nuevos nodos en el índice y en los conteos por tamaño
+        node = head
+        while node:
+            self._by_name.setdefault(node.client_name, []).append(node)
+            self._size_counts[node.party_size] = self._size_counts.get(node.party_size, 0) + 1
+            node = node.next
+
+    def _unlink(self, node):
+        """Desenlazar un nodo de la lista usando sus punteros anterior y siguiente"""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next  # Era la cabeza
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev  # Era la cola
+        node.prev = node.next = None
+
+    def _pop_from_index(self, node):
+        """Quitar un nodo del índice por nombre y del conteo por tamaño"""
+        nodes = self._by_name[node.client_name]
+        nodes.remove(node)
+        if not nodes:
+            del self._by_name[node.client_name]
+        self._size_counts[node.party_size] -= 1
+        if not self._size_counts[node.party_size]:
+            del self._size_counts[node.party_size]
 
     def call_next_table(self):
         """Llamar a la siguiente mesa disponible - Opera como una cola FIFO"""
@@ -43,87 +120,98 @@ class RestaurantWaitlist:
 
         current = self.head
         # Buscar una mesa adecuada para el tamaño del grupo
-        table_size = self._find_suitable_table(current.party_size)
+        idx = self._suitable_idx(current.party_size)
         
         # Si hay mesa disponible, asignarla al cliente
-        if table_size and self.tables[table_size] > 0:
-            self.tables[table_size] -= 1  # Ocupar mesa (decrementar contador)
+        if idx is not None and self._avail[idx] > 0:
+            self._avail[idx] -= 1  # Ocupar mesa (decrementar contador)
             client_name = current.client_name
-            self.head = current.next  # Remover el primer nodo de la lista (FIFO)
-            return True, f"Llamando a {client_name} para una mesa de {table_size} personas."
+            self._unlink(current)  # Remover el primer nodo de la lista (FIFO)
+            self._pop_from_index(current)
+            return True, f"Llamando a {client_name} para una mesa de {self._sizes[idx]} personas."
         else:
             return False, f"No hay mesas disponibles para {current.client_name} (grupo de {current.party_size})."
 
-    def _find_suitable_table(self, party_size):
-        """Encontrar la mesa más pequeña que pueda acomodar al grupo"""
-        # Ordenar los tamaños de mesa disponibles
-        for size in sorted(self.tables.keys()):
-            # La mesa debe ser al menos del tamaño del grupo
-            if party_size <= size:
-                return size
-        return None  # No hay mesa suficientemente grande
+    def _suitable_idx(self, party_size):
+        """Encontrar el índice de la mesa más pequeña que pueda acomodar al grupo"""
+        # Una sola consulta; None si no hay mesa suficientemente grande
+        return self._size_map.get(party_size)
 
-    def get_waitlist(self):
-        """Obtener la lista completa de espera como una lista de diccionarios"""
-        clients = []
+    def _iter_nodes(self):
+        """Recorrer la lista enlazada desde la cabeza, devolviendo cada nodo"""
         current = self.head
-        # Recorrer toda la lista enlazada
         while current:
-            clients.append({
-                'name': current.client_name,
-                'party_size': current.party_size,
-                'time': current.reservation_time
-            })
+            yield current
             current = current.next  # Avanzar al siguiente nodo
-        return clients
+
+    def get_waitlist(self):
+        """Obtener la lista completa de espera como tuplas (nombre, grupo, hora)"""
+        # Recorrer toda la lista enlazada en una sola pasada
+        return [(node.client_name, node.party_size, node.reservation_time)
+                for node in self._iter_nodes()]
 
     def cancel_reservation(self, client_name):
         """Cancelar una reservación buscando por nombre de cliente"""
         if not self.head:
             return False, "La lista de espera está vacía."
-        
-        # Caso especial: si el cliente a eliminar es el primero
-        if self.head.client_name == client_name:
-            self.head = self.head.next  # La cabeza apunta al siguiente nodo
-            return True, f"Reservación de {client_name} cancelada."
 
-        # Buscar el cliente en la lista
-        current = self.head
-        while current.next and current.next.client_name != client_name:
-            current = current.next
-        
-        # Si encontramos el cliente, eliminarlo de la lista
-        if current.next:
-            current.next = current.next.next  # Saltar el nodo a eliminar
-            return True, f"Reservación de {client_name} cancelada."
-        else:
+        # Buscar el cliente en el índice en lugar de recorrer la lista
+        nodes = self._by_name.get(client_name)
+        if not nodes:
             return False, f"No se encontró a {client_name} en la lista de espera."
 
+        # Si hay nombres repetidos, se cancela el que llegó primero
+        node = nodes[0]
+        self._pop_from_index(node)
+        self._unlink(node)
+        return True, f"Reservación de {client_name} cancelada."
+
     def estimate_wait_time(self, party_size):
         """Estimar tiempo de espera para un grupo basado en mesas disponibles y clientes en espera"""
-        count = 0
-        current = self.head
-        # Contar cuántos grupos del mismo tamaño o menor están en espera
-        while current:
-            if current.party_size <= party_size:
-                count += 1
-            current = current.next
-        
         # Encontrar una mesa adecuada para el grupo
-        table_size = self._find_suitable_table(party_size)
+        idx = self._suitable_idx(party_size)
+        if idx is None:
+            return -1  # El grupo nunca podrá ser sentado: no hace falta contar
+
+        # Contar cuántos grupos del mismo tamaño o menor están en espera
+        # usando los conteos por tamaño, sin recorrer la lista
+        count = sum(c for size, c in self._size_counts.items() if size <= party_size)
         
         # Calcular tiempo de espera estimado
-        if not table_size or self.tables[table_size] == 0:
+        if self._avail[idx] == 0:
             wait_time = count * self.wait_time_per_table
         else:
-            wait_time = (count - self.tables[table_size]) * self.wait_time_per_table
+            wait_time = (count - self._avail[idx]) * self.wait_time_per_table
         
         return max(0, wait_time)  # El tiempo no puede ser negativo
 
+    def iter_with_wait_estimates(self):
+        """Recorrer la lista una sola vez devolviendo cada nodo con su espera estimada"""
+        # Cantidad de grupos ya recorridos por cada tamaño de grupo
+        counts = {}
+        # Referencias locales: la tabla de búsqueda ya resuelve cada tamaño con
+        # una sola consulta, así que se evita además la llamada a _suitable_idx
+        suitable_idx = self._size_map.get
+        avail = self._avail
+        per_table = self.wait_time_per_table
+        for node in self._iter_nodes():
+            party_size = node.party_size
+            idx = suitable_idx(party_size)
+            if idx is None:
+                # Ninguna mesa acomoda al grupo: no hay espera que estimar
+                yield node, -1
+            else:
+                # Grupos del mismo tamaño o menor por delante, más el propio grupo
+                cum = sum(c for size, c in counts.items() if size <= party_size) + 1
+                wait_time = (cum - avail[idx]) * per_table
+                yield node, max(0, wait_time)
+            counts[party_size] = counts.get(party_size, 0) + 1
+
     def free_table(self, table_size):
         """Liberar una mesa - Incrementar el contador de mesas disponibles"""
-        if table_size in self.tables:
-            self.tables[table_size] += 1
+        idx = self._size_to_idx.get(table_size)
+        if idx is not None:
+            self._avail[idx] += 1
             return True
         return False
 
@@ -136,6 +224,11 @@ class RestaurantApp:
         self.root.configure(bg='#f0f0f0')
         
         self.waitlist = RestaurantWaitlist()  # Instancia de la lista de espera
+        # Filas mostradas en la tabla: nodo -> (id de fila, posición, espera)
+        self._rows = {}
+        self._refresh_pending = False  # Hay una actualización ya programada
+        self._tables_dirty = True  # Las mesas cambiaron desde la última actualización
+        self._status_after_id = None  # Temporizador que limpia la barra de estado
         
         self.setup_ui()      # Configurar la interfaz
         self.update_displays()  # Actualizar la visualización inicial
@@ -147,6 +240,10 @@ class RestaurantApp:
                             font=('Arial', 18, 'bold'), bg='#f0f0f0', fg='#333')
         title_label.pack(pady=10)
 
+        # Barra de estado inferior (no modal) para los mensajes de cada acción
+        self.status = tk.Label(self.root, text="", anchor='w', bg='#eee')
+        self.status.pack(side='bottom', fill='x')
+
         # Frame principal que contiene los paneles izquierdo y derecho
         main_frame = tk.Frame(self.root, bg='#f0f0f0')
         main_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -250,14 +347,21 @@ class RestaurantApp:
         """Manejar el evento de agregar un nuevo cliente"""
         name = self.name_entry.get().strip()
         if not name:
-            messagebox.showerror("Error", "Por favor ingrese el nombre del cliente")
+            self._show_status("Por favor ingrese el nombre del cliente", '#C62828')
             return
         
         party_size = int(self.size_var.get())
-        time = self.time_entry.get().strip()
+        # Convertir la hora "HH:MM" a minutos desde medianoche una sola vez
+        try:
+            hours, minutes = map(int, self.time_entry.get().strip().split(':'))
+        except ValueError:
+            hours = minutes = -1
+        if not (0 <= hours < 24 and 0 <= minutes < 60):
+            self._show_status("Por favor ingrese la hora en formato HH:MM", '#C62828')
+            return
         
         # Añadir cliente a la lista enlazada
-        self.waitlist.add_client(name, party_size, time)
+        self.waitlist.add_client(name, party_size, hours * 60 + minutes)
         
         # Limpiar campos y restablecer valores por defecto
         self.name_entry.delete(0, tk.END)
@@ -265,66 +369,105 @@ class RestaurantApp:
         self.time_entry.insert(0, datetime.now().strftime("%H:%M"))
         
         # Actualizar la visualización
-        self.update_displays()
-        messagebox.showinfo("Éxito", f"Cliente {name} agregado a la lista de espera")
+        self._schedule_refresh()
+        self._show_status(f"Cliente {name} agregado a la lista de espera", '#2E7D32')
 
     def call_next(self):
         """Manejar el evento de llamar a la siguiente mesa"""
         success, message = self.waitlist.call_next_table()
         if success:
-            messagebox.showinfo("Mesa Asignada", message)
+            self._tables_dirty = True  # Se ocupó una mesa
+            self._show_status(message, '#2E7D32')
         else:
-            messagebox.showwarning("Sin Mesas", message)
-        self.update_displays()
+            self._show_status(message, '#E65100')
+        self._schedule_refresh()
 
     def cancel_reservation(self):
         """Manejar el evento de cancelar una reservación"""
         name = self.cancel_entry.get().strip()
         if not name:
-            messagebox.showerror("Error", "Por favor ingrese el nombre del cliente")
+            self._show_status("Por favor ingrese el nombre del cliente", '#C62828')
             return
         
         # Intentar cancelar la reservación
         success, message = self.waitlist.cancel_reservation(name)
         if success:
-            messagebox.showinfo("Cancelación", message)
+            self._show_status(message, '#2E7D32')
         else:
-            messagebox.showwarning("Error", message)
+            self._show_status(message, '#E65100')
         
         # Limpiar campo y actualizar visualización
         self.cancel_entry.delete(0, tk.END)
-        self.update_displays()
+        self._schedule_refresh()
 
     def free_table(self):
         """Manejar el evento de liberar una mesa"""
         table_size = int(self.free_var.get())
         if self.waitlist.free_table(table_size):
-            messagebox.showinfo("Mesa Liberada", f"Mesa para {table_size} personas liberada")
-            self.update_displays()
+            self._tables_dirty = True
+            self._show_status(f"Mesa para {table_size} personas liberada", '#2E7D32')
+            self._schedule_refresh()
+
+    def _show_status(self, message, color):
+        """Mostrar un mensaje en la barra de estado y borrarlo tras unos segundos"""
+        self.status.config(text=message, fg=color)
+        # Reiniciar el temporizador para que un mensaje nuevo no se borre antes de tiempo
+        if self._status_after_id:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(3000, self._clear_status)
+
+    def _clear_status(self):
+        """Limpiar la barra de estado"""
+        self._status_after_id = None
+        self.status.config(text="")
+
+    def _schedule_refresh(self):
+        """Programar una actualización para cuando la interfaz esté inactiva"""
+        # Varios eventos seguidos se agrupan en una sola actualización
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Ejecutar la actualización programada"""
+        self._refresh_pending = False
+        self.update_displays()
 
     def update_displays(self):
         """Actualizar todos los elementos visuales de la interfaz"""
-        # Limpiar la tabla actual
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Obtener la lista actual de clientes
-        clients = self.waitlist.get_waitlist()
-        
-        # Llenar la tabla con los clientes
-        for i, client in enumerate(clients, 1):
-            # Calcular tiempo de espera estimado
-            wait_time = self.waitlist.estimate_wait_time(client['party_size'])
-            self.tree.insert('', 'end', values=(
-                i, client['name'], f"{client['party_size']} personas", 
-                client['time'], f"{wait_time} min"
-            ))
+        # Aplicar solo los cambios a la tabla en lugar de reconstruirla
+        rows = {}
+        clients = self.waitlist.iter_with_wait_estimates()
+        for i, (node, wait_time) in enumerate(clients, 1):
+            wait = f"{wait_time} min" if wait_time >= 0 else "N/A"
+            row = self._rows.pop(node, None)
+            if row is None:
+                # Cliente nuevo: se agrega al final (la lista es FIFO)
+                iid = self.tree.insert('', 'end', values=(
+                    i, node.client_name, f"{node.party_size} personas",
+                    f"{node.reservation_time // 60:02d}:{node.reservation_time % 60:02d}", wait
+                ))
+            else:
+                # Cliente existente: actualizar solo las columnas que cambiaron
+                iid, position, old_wait = row
+                if position != i:
+                    self.tree.set(iid, 'Posición', i)
+                if old_wait != wait:
+                    self.tree.set(iid, 'Espera Estimada', wait)
+            rows[node] = (iid, i, wait)
+
+        # Las filas que quedan corresponden a clientes que salieron de la lista
+        for iid, _, _ in self._rows.values():
+            self.tree.delete(iid)
+        self._rows = rows
         
-        # Actualizar información de mesas disponibles
-        tables_info = "Mesas Disponibles:\n"
-        for size, count in self.waitlist.tables.items():
-            tables_info += f"• {size} personas: {count} mesas\n"
-        self.tables_label.config(text=tables_info)
+        # Actualizar información de mesas disponibles solo si cambiaron
+        if self._tables_dirty:
+            tables_info = "Mesas Disponibles:\n"
+            for size, count in self.waitlist.tables.items():
+                tables_info += f"• {size} personas: {count} mesas\n"
+            self.tables_label.config(text=tables_info)
+            self._tables_dirty = False
 
 # Punto de entrada de la aplicación
 if __name__ == "__main__":